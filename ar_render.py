@@ -12,11 +12,25 @@ the ground plane.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Tuple
+from functools import lru_cache
+from typing import Callable, Tuple
 
 import cv2
 import numpy as np
+from numpy.typing import ArrayLike
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to the NumPy blend.
+    njit = None
+
+try:
+    import cupy as cp
+    from cupyx.scipy import ndimage as cpx_ndimage
+except ImportError:  # cupy is optional; only needed for backend="gpu".
+    cp = None
 
 
 @dataclass
@@ -66,16 +80,18 @@ def load_rgba(path: str) -> Tuple[np.ndarray, np.ndarray]:
     -------
     tuple
         A tuple ``(rgb, alpha)`` where ``rgb`` is a BGR image (as
-        returned by OpenCV) and ``alpha`` is a single‑channel float array
-        in the range [0, 1].
+        returned by OpenCV) and ``alpha`` is a single‑channel ``uint8``
+        array in the range [0, 255].
     """
     rgba = cv2.imread(path, cv2.IMREAD_UNCHANGED)
     if rgba is None:
         raise FileNotFoundError(f"Could not load image at {path}")
     if rgba.shape[2] != 4:
         raise ValueError("Image must have an alpha channel (RGBA)")
-    bgr = rgba[:, :, :3]
-    alpha = rgba[:, :, 3].astype(np.float32) / 255.0
+    # Split into contiguous arrays: strided channel views would force
+    # OpenCV to copy them on every resize and defeat its SIMD paths.
+    bgr = np.ascontiguousarray(rgba[:, :, :3])
+    alpha = np.ascontiguousarray(rgba[:, :, 3])
     return bgr, alpha
 
 
@@ -115,67 +131,341 @@ def compute_object_size_px(
         negative indicates that the object cannot be placed at the given
         position (e.g. above the horizon).
     """
+    return int(
+        _object_size_px(
+            camera.focal_length_mm,
+            camera.sensor_height_mm,
+            camera.camera_height_mm,
+            camera.ground_distance_mm,
+            bg_height_px,
+            y_px,
+            object_height_m,
+        )
+    )
+
+
+def _projected_height_mm(
+    below_horizon_mm,
+    focal_length_mm: float,
+    camera_height_mm: float,
+    ground_distance_mm: float,
+    H_mm: float,
+):
+    """Height of an object's projection on the sensor in millimetres.
+
+    ``below_horizon_mm`` is the distance of the object base below the
+    horizon on the sensor and may be a scalar or an array.  This is the
+    single definition of the projection geometry shared by the scalar
+    and batch size computations, which keeps them in exact agreement.
+    """
+    # Distance from camera to the point on the ground beneath the object.
+    x_r_mm = (focal_length_mm * camera_height_mm) / below_horizon_mm - ground_distance_mm
+
+    # Height of the object's projection on the sensor in millimetres.
+    return below_horizon_mm - (focal_length_mm * (camera_height_mm - H_mm)) / (
+        ground_distance_mm + x_r_mm
+    )
+
+
+def _object_size_px(
+    focal_length_mm: float,
+    sensor_height_mm: float,
+    camera_height_mm: float,
+    ground_distance_mm: float,
+    bg_height_px: int,
+    y_px: int,
+    object_height_m: float,
+) -> int:
+    """Scalar kernel of :func:`compute_object_size_px` on plain numbers.
+
+    Works on plain floats rather than NumPy scalars or arrays, which keeps
+    the per-call cost of single positions low.
+    """
+    H_mm = object_height_m * 1000.0
+    half_sensor_mm = sensor_height_mm * 0.5
+    pixel_per_mm = bg_height_px / sensor_height_mm
+    mm_per_pixel = sensor_height_mm / bg_height_px
+    x_y_mm = (bg_height_px - y_px) * mm_per_pixel
+    if x_y_mm >= half_sensor_mm:
+        return 0
+    h_mm = _projected_height_mm(
+        half_sensor_mm - x_y_mm,
+        focal_length_mm,
+        camera_height_mm,
+        ground_distance_mm,
+        H_mm,
+    )
+    return int(h_mm * pixel_per_mm)
+
+
+def compute_object_size_px_batch(
+    camera: CameraParams,
+    bg_height_px: int,
+    y_px: ArrayLike,
+    object_height_m: float,
+) -> np.ndarray:
+    """Vectorised form of :func:`compute_object_size_px`.
+
+    Evaluates the same geometry for any number of vertical positions at
+    once, which avoids per-position interpreter overhead when scoring
+    many candidate placements.
+
+    Parameters
+    ----------
+    camera : CameraParams
+        Camera geometry parameters.
+
+    bg_height_px : int
+        Height of the background image in pixels.
+
+    y_px : array_like of int
+        Vertical positions of the object base in pixels (measured from
+        the top of the image).
+
+    object_height_m : float
+        Real‑world height of the object in metres.
+
+    Returns
+    -------
+    ndarray
+        Integer array with the same shape as ``y_px`` holding the object
+        height in pixels at each position.  Positions on or above the
+        horizon yield zero.
+    """
+    y_px = np.asarray(y_px, dtype=np.float64)
+
     # Convert real heights to millimetres.
     H_mm = object_height_m * 1000.0
     # Pixels per millimetre on the sensor: background height corresponds
-    # to the physical sensor height (sensor_height_mm).
+    # to the physical sensor height (sensor_height_mm).  The reciprocal is
+    # hoisted so that the per-position conversion is a multiply.
     pixel_per_mm = bg_height_px / camera.sensor_height_mm
+    mm_per_pixel = camera.sensor_height_mm / bg_height_px
+    half_sensor_mm = camera.sensor_height_mm * 0.5
 
     # Compute the vertical coordinate on the sensor in millimetres.  The
     # origin of the sensor coordinate system is at the centre, so convert
     # from image coordinates (origin at top left).
-    x_y_mm = (bg_height_px - y_px) / pixel_per_mm
+    x_y_mm = (bg_height_px - y_px) * mm_per_pixel
+
+    # Objects on or above the horizon (sensor height / 2) cannot be
+    # placed.  Substitute a dummy denominator there so the arithmetic
+    # below stays finite; those entries are zeroed at the end.
+    above_horizon = x_y_mm >= half_sensor_mm
+    below_horizon_mm = np.where(above_horizon, 1.0, half_sensor_mm - x_y_mm)
+
+    h_mm = _projected_height_mm(
+        below_horizon_mm,
+        camera.focal_length_mm,
+        camera.camera_height_mm,
+        camera.ground_distance_mm,
+        H_mm,
+    )
+    h_px = (h_mm * pixel_per_mm).astype(np.int64)
+    return np.where(above_horizon, 0, h_px)
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _blend_u8_kernel(fg, bg, alpha, out):
+        """Fused per-pixel fixed-point blend, parallel over rows.
+
+        Fully transparent and fully opaque pixels are copied straight
+        from ``bg`` and ``fg`` without any arithmetic.
+        """
+        h, w = alpha.shape
+        for y in prange(h):
+            for x in range(w):
+                a = np.uint16(alpha[y, x])
+                if a == 0:
+                    for c in range(3):
+                        out[y, x, c] = bg[y, x, c]
+                    continue
+                if a == 255:
+                    for c in range(3):
+                        out[y, x, c] = fg[y, x, c]
+                    continue
+                ia = np.uint16(255) - a
+                for c in range(3):
+                    t = (
+                        np.uint16(fg[y, x, c]) * a
+                        + np.uint16(bg[y, x, c]) * ia
+                        + np.uint16(128)
+                    )
+                    out[y, x, c] = np.uint8((t + (t >> 8)) >> 8)
+
+
+if cp is not None:
+    _blend_u8_gpu = cp.ElementwiseKernel(
+        "uint8 fg, uint8 bg, uint8 a",
+        "uint8 out",
+        """
+        unsigned int t = fg * a + bg * (255 - a) + 128;
+        out = (t + (t >> 8)) >> 8;
+        """,
+        "ar_render_blend_u8",
+    )
 
-    # Objects above the horizon (sensor height / 2) cannot be placed.
-    if x_y_mm > (camera.sensor_height_mm / 2):
-        return 0
 
-    # Distance from camera to the point on the ground beneath the object.
-    x_r_mm = (
-        (camera.focal_length_mm * camera.camera_height_mm)
-        / ((camera.sensor_height_mm / 2) - x_y_mm)
-        - camera.ground_distance_mm
-    )
+def _resize_gpu(image, target_h: int, target_w: int, order: int):
+    """Resize a CuPy image to ``(target_h, target_w)`` with spline ``order``.
 
-    # Height of the object's projection on the sensor in millimetres.
-    h_mm = (
-        (camera.sensor_height_mm / 2)
-        - x_y_mm
-        - (camera.focal_length_mm * (camera.camera_height_mm - H_mm))
-        / (camera.ground_distance_mm + x_r_mm)
+    Pixel centres are aligned as in ``cv2.resize``.  When shrinking, a box
+    prefilter of roughly the downscale factor stands in for OpenCV's
+    ``INTER_AREA`` so the result does not alias.
+    """
+    orig_h, orig_w = image.shape[:2]
+    sy, sx = orig_h / target_h, orig_w / target_w
+    src = image.astype(cp.float32)
+    if sy > 1.0 or sx > 1.0:
+        box = (max(1, round(sy)), max(1, round(sx))) + (1,) * (src.ndim - 2)
+        src = cpx_ndimage.uniform_filter(src, size=box, mode="nearest")
+    scales = (sy, sx) + (1.0,) * (src.ndim - 2)
+    offsets = (0.5 * sy - 0.5, 0.5 * sx - 0.5) + (0.0,) * (src.ndim - 2)
+    resized = cpx_ndimage.affine_transform(
+        src,
+        cp.asarray(scales),
+        offset=offsets,
+        output_shape=(target_h, target_w) + src.shape[2:],
+        order=order,
+        mode="nearest",
     )
-    h_px = int(h_mm * pixel_per_mm)
-    return h_px
+    return cp.clip(cp.rint(resized), 0, 255).astype(cp.uint8)
 
 
-def paste_object(
-    background: np.ndarray,
+def _prepare_object_gpu(
     object_bgr: np.ndarray,
     object_alpha: np.ndarray,
+    target_h: int,
+):
+    """GPU counterpart of :func:`prepare_object` returning CuPy arrays."""
+    _check_alpha(object_alpha)
+    orig_h, orig_w = object_bgr.shape[:2]
+    target_w = int(orig_w / orig_h * target_h)
+    # Same interpolation policy as the CPU path: linear up to 2x, cubic
+    # beyond, and a box-filtered linear resample when shrinking.
+    order = 3 if target_h / orig_h >= 2.0 else 1
+    resized_bgr = _resize_gpu(cp.asarray(object_bgr), target_h, target_w, order)
+    resized_alpha = _resize_gpu(cp.asarray(object_alpha), target_h, target_w, 1)
+    return resized_bgr, resized_alpha
+
+
+# Tile edge, in pixels, for the NumPy blend.  A 128x128 tile keeps the
+# uint8 inputs plus the uint16 intermediate (~200 KB) resident in L2.
+_BLEND_TILE = 128
+
+
+_scratch = threading.local()
+
+
+def _tile_scratch() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return this thread's preallocated buffers for one blend tile."""
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        buffers = (
+            np.empty((_BLEND_TILE, _BLEND_TILE, 3), np.uint16),
+            np.empty((_BLEND_TILE, _BLEND_TILE, 3), np.uint16),
+            np.empty((_BLEND_TILE, _BLEND_TILE, 1), np.uint8),
+        )
+        _scratch.buffers = buffers
+    return buffers
+
+
+def _blend_u8_tile(
+    fg: np.ndarray, bg: np.ndarray, alpha: np.ndarray, out: np.ndarray
+) -> None:
+    """NumPy fixed-point blend of a single tile into ``out``.
+
+    Every step writes into preallocated scratch via ``out=``, so the
+    blend allocates nothing and widens uint8 to uint16 inside the
+    multiplies rather than in separate ``astype`` passes.
+    """
+    h, w = alpha.shape
+    t, u, inv_a = (buf[:h, :w] for buf in _tile_scratch())
+    # Zero-copy (H, W, 1) view of the uint8 mask; NumPy broadcasts it over
+    # the channels.
+    a = alpha[:, :, None]
+    np.subtract(255, a, out=inv_a)
+    np.multiply(fg, a, out=t, dtype=np.uint16)
+    np.multiply(bg, inv_a, out=u, dtype=np.uint16)
+    np.add(t, u, out=t)
+    np.add(t, 128, out=t)
+    np.right_shift(t, 8, out=u)
+    np.add(t, u, out=t)
+    np.right_shift(t, 8, out=t)
+    np.copyto(out, t, casting="unsafe")
+
+
+def _blend_u8(
+    fg: np.ndarray,
+    bg: np.ndarray,
+    alpha: np.ndarray,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Alpha-blend two ``uint8`` BGR images with a ``uint8`` alpha mask.
+
+    The blend is computed in fixed point with ``uint16`` intermediates,
+    ``t = fg * a + bg * (255 - a) + 128`` followed by the exact rounding
+    division ``(t + (t >> 8)) >> 8``, so no operand is ever promoted to
+    float32.  When numba is installed the blend runs as a single fused,
+    multi-threaded pass; otherwise it falls back to NumPy, processing the
+    image in cache-sized tiles with the mask broadcast over the channel
+    axis.  The numba kernel copies pixels whose alpha is 0 or 255 without
+    any arithmetic; the NumPy path does the same for whole 128x128 tiles
+    that are uniformly 0 or 255, and blends every pixel of mixed tiles.
+    If ``fg`` and ``alpha`` are CuPy arrays the blend runs on the GPU
+    instead.  ``out`` may alias ``bg``.
+    """
+    if cp is not None and isinstance(fg, cp.ndarray):
+        # Device-resident object: upload only the background ROI, blend
+        # in one fused kernel and copy the result back.
+        blended = _blend_u8_gpu(fg, cp.asarray(bg), alpha[:, :, None])
+        if out is None:
+            return blended.get()
+        out[...] = blended.get()
+        return out
+    if out is None:
+        out = np.empty_like(fg)
+    if njit is not None:
+        _blend_u8_kernel(fg, bg, alpha, out)
+        return out
+    h, w = alpha.shape
+    for ty in range(0, h, _BLEND_TILE):
+        for tx in range(0, w, _BLEND_TILE):
+            tile = (slice(ty, ty + _BLEND_TILE), slice(tx, tx + _BLEND_TILE))
+            tile_alpha = alpha[tile]
+            # Tiles that are entirely transparent or entirely opaque are
+            # plain copies; only mixed tiles need the arithmetic.
+            if not tile_alpha.any():
+                if out is not bg:
+                    out[tile] = bg[tile]
+            elif tile_alpha.min() == 255:
+                out[tile] = fg[tile]
+            else:
+                _blend_u8_tile(fg[tile], bg[tile], tile_alpha, out[tile])
+    return out
+
+
+def object_bounds(
+    background_shape: Tuple[int, ...],
+    object_shape: Tuple[int, ...],
     location: Tuple[int, int],
     object_height_m: float,
     camera: CameraParams,
-) -> np.ndarray:
-    """Paste a scaled object onto a background image.
-
-    The object is scaled according to its real‑world height and the
-    specified location on the ground plane.  The object's base will be
-    aligned with the ``location`` pixel, which must lie on the ground plane.
+) -> Tuple[int, int, int, int]:
+    """Compute the region of the background covered by a pasted object.
 
     Parameters
     ----------
-    background : ndarray
-        Colour background image (BGR) into which the object will be pasted.
+    background_shape : tuple of int
+        Shape of the background image, ``(height, width[, channels])``.
 
-    object_bgr : ndarray
-        Colour channels of the object image (BGR).
-
-    object_alpha : ndarray
-        Alpha channel of the object image in the range [0, 1].
+    object_shape : tuple of int
+        Shape of the unscaled object image.
 
     location : tuple of int
-        Coordinates ``(y_px, x_px)`` of the point on the image where the
-        bottom centre of the object should be placed.
+        Coordinates ``(y_px, x_px)`` of the bottom centre of the object.
 
     object_height_m : float
         Real‑world height of the object in metres.
@@ -185,12 +475,18 @@ def paste_object(
 
     Returns
     -------
-    ndarray
-        New background image with the object rendered onto it.  The
-        original background is not modified.
+    tuple of int
+        ``(top, bottom, left, right)`` bounds of the object in background
+        pixel coordinates.
+
+    Raises
+    ------
+    ValueError
+        If the object lies above the horizon or would extend beyond the
+        background boundaries.
     """
     y_px, x_px = location
-    bg_h, bg_w = background.shape[:2]
+    bg_h, bg_w = background_shape[:2]
 
     # Compute desired object height in pixels.
     target_h = compute_object_size_px(
@@ -202,14 +498,10 @@ def paste_object(
         )
 
     # Preserve aspect ratio based on original object size.
-    orig_h, orig_w = object_bgr.shape[:2]
+    orig_h, orig_w = object_shape[:2]
     aspect = orig_w / orig_h
     target_w = int(aspect * target_h)
 
-    # Resize the object and alpha mask.
-    resized_bgr = cv2.resize(object_bgr, (target_w, target_h), interpolation=cv2.INTER_CUBIC)
-    resized_alpha = cv2.resize(object_alpha, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
-
     # Determine the region of interest on the background.
     top = y_px - target_h
     bottom = y_px
@@ -219,17 +511,306 @@ def paste_object(
     # Check boundaries.
     if top < 0 or bottom > bg_h or left < 0 or right > bg_w:
         raise ValueError("The object would extend beyond the background boundaries")
+    return top, bottom, left, right
+
+
+def _copy_outside(
+    src: np.ndarray, dst: np.ndarray, top: int, bottom: int, left: int, right: int
+) -> None:
+    """Copy every pixel of ``src`` into ``dst`` except the given box."""
+    dst[:top] = src[:top]
+    dst[bottom:] = src[bottom:]
+    dst[top:bottom, :left] = src[top:bottom, :left]
+    dst[top:bottom, right:] = src[top:bottom, right:]
+
+
+def _check_alpha(object_alpha) -> None:
+    """Reject alpha masks that are not ``uint8``.
 
-    # Copy the background and extract ROI.
-    result = background.copy()
-    roi = result[top:bottom, left:right]
+    Masks used to be float arrays in [0, 1]; blending one as if it were
+    in [0, 255] would silently render an almost invisible object.
+    """
+    if object_alpha.dtype != np.uint8:
+        raise TypeError(
+            f"Alpha mask must be uint8 in the range [0, 255], got {object_alpha.dtype}"
+        )
+
+
+def prepare_object(
+    object_bgr: np.ndarray,
+    object_alpha: np.ndarray,
+    target_h: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Resize an object and its alpha mask to a given pixel height.
+
+    Parameters
+    ----------
+    object_bgr : ndarray
+        Colour channels of the object image (BGR).
+
+    object_alpha : ndarray
+        Alpha channel of the object image as ``uint8``.
 
-    # Blend object onto ROI using alpha mask.
-    alpha_3ch = np.dstack([resized_alpha] * 3)
-    blended = (
-        resized_bgr.astype(np.float32) * alpha_3ch
-        + roi.astype(np.float32) * (1.0 - alpha_3ch)
-    ).astype(np.uint8)
+    target_h : int
+        Desired object height in pixels.  The width follows from the
+        object's aspect ratio.
 
-    result[top:bottom, left:right] = blended
+    Returns
+    -------
+    tuple
+        ``(resized_bgr, resized_alpha)``.
+
+    Raises
+    ------
+    TypeError
+        If ``object_alpha`` is not ``uint8``.
+    """
+    _check_alpha(object_alpha)
+
+    # Preserve aspect ratio based on original object size.
+    orig_h, orig_w = object_bgr.shape[:2]
+    target_w = int(orig_w / orig_h * target_h)
+
+    # For large reductions, halve the image with pyrDown until it is
+    # within 2x of the target.  Each level is a cheap separable 5-tap
+    # filter on a quarter of the previous pixels, so the final resize
+    # only has to cover the remaining factor of at most two.
+    while orig_h > 2 * target_h:
+        object_bgr = cv2.pyrDown(object_bgr)
+        object_alpha = cv2.pyrDown(object_alpha)
+        orig_h = object_bgr.shape[0]
+
+    # Area averaging is both faster and alias-free when shrinking;
+    # bilinear is visually indistinguishable from bicubic for modest
+    # enlargements, so bicubic is reserved for large upscales where its
+    # sharper reconstruction is noticeable.
+    scale = target_h / orig_h
+    if scale < 1.0:
+        interp = cv2.INTER_AREA
+    elif scale < 2.0:
+        interp = cv2.INTER_LINEAR
+    else:
+        interp = cv2.INTER_CUBIC
+    resized_bgr = cv2.resize(object_bgr, (target_w, target_h), interpolation=interp)
+    resized_alpha = cv2.resize(object_alpha, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
+    return resized_bgr, resized_alpha
+
+
+def make_prepare_cache(
+    object_bgr: np.ndarray,
+    object_alpha: np.ndarray,
+    quantum_px: int = 2,
+    maxsize: int | None = 4,
+) -> Callable[[int], Tuple[np.ndarray, np.ndarray]]:
+    """Return a memoised :func:`prepare_object` for a single object.
+
+    Target heights are rounded to the nearest multiple of ``quantum_px``
+    before lookup, so nearby placements share one resize.  The cached
+    arrays are marked read-only because they are shared between calls.
+
+    Parameters
+    ----------
+    object_bgr : ndarray
+        Colour channels of the object image (BGR).
+
+    object_alpha : ndarray
+        Alpha channel of the object image as ``uint8``.
+
+    quantum_px : int, optional
+        Height quantisation step in pixels.  Default is 2.
+
+    maxsize : int or None, optional
+        Maximum number of cached sizes, as for
+        :func:`functools.lru_cache`.  A near-camera object can take
+        several MB per size, so keep this small.  Default is 4.
+
+    Returns
+    -------
+    callable
+        Function mapping a target height in pixels to
+        ``(resized_bgr, resized_alpha)``.
+    """
+
+    @lru_cache(maxsize=maxsize)
+    def _prepare(quantised_h: int) -> Tuple[np.ndarray, np.ndarray]:
+        resized_bgr, resized_alpha = prepare_object(
+            object_bgr, object_alpha, quantised_h
+        )
+        resized_bgr.setflags(write=False)
+        resized_alpha.setflags(write=False)
+        return resized_bgr, resized_alpha
+
+    def prepare(target_h: int) -> Tuple[np.ndarray, np.ndarray]:
+        quantised_h = max(quantum_px, int(round(target_h / quantum_px)) * quantum_px)
+        return _prepare(quantised_h)
+
+    return prepare
+
+
+def blit(
+    background: np.ndarray,
+    object_bgr: np.ndarray,
+    object_alpha: np.ndarray,
+    top: int,
+    left: int,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
+) -> np.ndarray:
+    """Alpha-blend an already scaled object onto a background image.
+
+    Parameters
+    ----------
+    background : ndarray
+        Colour background image (BGR).
+
+    object_bgr : ndarray
+        Colour channels of the scaled object (BGR).
+
+    object_alpha : ndarray
+        Alpha channel of the scaled object as ``uint8``.
+
+    top, left : int
+        Background coordinates of the object's top-left corner.
+
+    out : ndarray, optional
+        Preallocated output array; see :func:`paste_object`.
+
+    inplace : bool, optional
+        Render directly into ``background``; see :func:`paste_object`.
+
+    Returns
+    -------
+    ndarray
+        Background image with the object rendered onto it.
+
+    Raises
+    ------
+    ValueError
+        If the object would extend beyond the background boundaries.
+
+    TypeError
+        If ``object_alpha`` is not ``uint8``.
+    """
+    _check_alpha(object_alpha)
+    bg_h, bg_w = background.shape[:2]
+    obj_h, obj_w = object_bgr.shape[:2]
+    bottom = top + obj_h
+    right = left + obj_w
+    if top < 0 or bottom > bg_h or left < 0 or right > bg_w:
+        raise ValueError("The object would extend beyond the background boundaries")
+
+    # Shrink the ROI to the bounding box of the object's non-transparent
+    # pixels; object PNGs typically have wide fully transparent margins
+    # that would otherwise be blended for nothing.
+    rows = object_alpha.any(axis=1)
+    cols = object_alpha.any(axis=0)
+    if cp is not None and isinstance(object_alpha, cp.ndarray):
+        rows, cols = rows.get(), cols.get()
+    ys = np.flatnonzero(rows)
+    xs = np.flatnonzero(cols)
+    if ys.size == 0:
+        # Nothing visible to paste.
+        if inplace or out is background:
+            return background
+        if out is None:
+            return background.copy()
+        out[...] = background
+        return out
+    y0, y1, x0, x1 = ys[0], ys[-1] + 1, xs[0], xs[-1] + 1
+    object_bgr = object_bgr[y0:y1, x0:x1]
+    object_alpha = object_alpha[y0:y1, x0:x1]
+    top, bottom, left, right = top + y0, top + y1, left + x0, left + x1
+
+    # Pick the output buffer.  Rather than copying the whole background
+    # and then overwriting the ROI, copy only the pixels outside the ROI
+    # and let the blend read from the background and write the ROI.
+    if inplace or out is background:
+        result = background
+    else:
+        result = np.empty_like(background) if out is None else out
+        _copy_outside(background, result, top, bottom, left, right)
+
+    # Blend object onto ROI using alpha mask, writing straight into the
+    # ROI view of the result.
+    _blend_u8(
+        object_bgr,
+        background[top:bottom, left:right],
+        object_alpha,
+        out=result[top:bottom, left:right],
+    )
     return result
+
+
+def paste_object(
+    background: np.ndarray,
+    object_bgr: np.ndarray,
+    object_alpha: np.ndarray,
+    location: Tuple[int, int],
+    object_height_m: float,
+    camera: CameraParams,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
+    backend: str = "cpu",
+) -> np.ndarray:
+    """Paste a scaled object onto a background image.
+
+    The object is scaled according to its real‑world height and the
+    specified location on the ground plane.  The object's base will be
+    aligned with the ``location`` pixel, which must lie on the ground plane.
+
+    Parameters
+    ----------
+    background : ndarray
+        Colour background image (BGR) into which the object will be pasted.
+
+    object_bgr : ndarray
+        Colour channels of the object image (BGR).
+
+    object_alpha : ndarray
+        Alpha channel of the object image as ``uint8`` in the range
+        [0, 255].
+
+    location : tuple of int
+        Coordinates ``(y_px, x_px)`` of the point on the image where the
+        bottom centre of the object should be placed.
+
+    object_height_m : float
+        Real‑world height of the object in metres.
+
+    camera : CameraParams
+        Camera geometry used to compute the projected size of the object.
+
+    out : ndarray, optional
+        Preallocated array with the same shape and dtype as ``background``
+        that receives the result.  Only the pixels outside the object's
+        region are copied from the background; the region itself is
+        written by the blend.
+
+    inplace : bool, optional
+        If true, render directly into ``background`` and return it.  Only
+        the object's region is touched.  Default is ``False``.
+
+    backend : {"cpu", "gpu"}, optional
+        Where to resize and blend the object.  ``"gpu"`` requires CuPy and
+        only transfers the object and the background region it covers to
+        the device.  Default is ``"cpu"``.
+
+    Returns
+    -------
+    ndarray
+        Background image with the object rendered onto it.  Unless
+        ``inplace`` is set, the original background is not modified.
+    """
+    if backend not in ("cpu", "gpu"):
+        raise ValueError(f"Unknown backend '{backend}'. Expected 'cpu' or 'gpu'.")
+    if backend == "gpu" and cp is None:
+        raise ImportError("The 'gpu' backend requires CuPy to be installed")
+
+    top, bottom, left, right = object_bounds(
+        background.shape, object_bgr.shape, location, object_height_m, camera
+    )
+    prepare = _prepare_object_gpu if backend == "gpu" else prepare_object
+    resized_bgr, resized_alpha = prepare(object_bgr, object_alpha, bottom - top)
+    return blit(
+        background, resized_bgr, resized_alpha, top, left, out=out, inplace=inplace
+    )
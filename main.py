@@ -30,11 +30,111 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 import cv2
+import numpy as np
 
-from ar_render import CameraParams, load_rgba, paste_object
+from ar_render import (
+    CameraParams,
+    blit,
+    compute_object_size_px_batch,
+    load_rgba,
+    make_prepare_cache,
+)
+
+
+# Per-process state for the render workers, set once by ``_init_worker``
+# so the background and object are not re-sent with every task.
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    bg_bgr: np.ndarray,
+    obj_bgr: np.ndarray,
+    obj_alpha: np.ndarray,
+    cache_size: int,
+) -> None:
+    """Initialise a render worker process."""
+    # Parallelism comes from the process pool; keep OpenCV and the Numba
+    # blend kernel to one thread per worker to avoid oversubscribing the
+    # cores.
+    cv2.setNumThreads(1)
+    try:
+        import numba
+    except ImportError:
+        pass
+    else:
+        numba.set_num_threads(1)
+    _worker_state["background"] = bg_bgr
+    _worker_state["rendered"] = bg_bgr.copy()
+    # Heights arrive already binned by main() (or exact when binning is
+    # off), so the cache must not round them again.
+    _worker_state["prepare"] = make_prepare_cache(
+        obj_bgr, obj_alpha, quantum_px=1, maxsize=cache_size
+    )
+
+
+def _render_one(
+    i: int,
+    position: Tuple[int, int],
+    target_h: int,
+    outdir: str,
+    ext: str,
+    write_params: List[int],
+) -> str:
+    """Render the object at one position and write it to ``outdir``.
+
+    The image is saved as ``render_<i>.<ext>`` with the given
+    ``cv2.imwrite`` encoder parameters.
+
+    Runs in a worker process.  The worker's copy of the background is
+    rendered into in place and the object's region is restored from the
+    original afterwards, so only the object's pixels are rewritten per
+    position.  Returns the path of the written image.
+    """
+    background = _worker_state["background"]
+    rendered = _worker_state["rendered"]
+    prepare = _worker_state["prepare"]
+
+    y_px, x_px = position
+    if target_h <= 0:
+        raise ValueError(
+            "Object cannot be rendered above the horizon or with non‑positive height"
+        )
+    resized_bgr, resized_alpha = prepare(target_h)
+    obj_h, obj_w = resized_bgr.shape[:2]
+    top = y_px - obj_h
+    left = x_px - obj_w // 2
+    blit(rendered, resized_bgr, resized_alpha, top, left, inplace=True)
+    try:
+        out_path = os.path.join(outdir, f"render_{i}.{ext}")
+        cv2.imwrite(out_path, rendered, write_params)
+    finally:
+        rendered[top : top + obj_h, left : left + obj_w] = background[
+            top : top + obj_h, left : left + obj_w
+        ]
+    return out_path
+
+
+def _bin_heights(target_hs: np.ndarray, bins_per_octave: int) -> np.ndarray:
+    """Snap object heights to a logarithmic grid of sizes.
+
+    With ``bins_per_octave`` bins every doubling of size, heights move by
+    at most ``2 ** (0.5 / bins_per_octave) - 1`` (about 3% for 12 bins),
+    and every position falling into the same bin reuses one resize.
+    Non‑positive heights and ``bins_per_octave <= 0`` are left unchanged.
+    """
+    if bins_per_octave <= 0:
+        return target_hs
+    valid = target_hs > 0
+    binned = target_hs.copy()
+    log_h = np.log2(target_hs[valid])
+    binned[valid] = np.rint(
+        np.exp2(np.round(log_h * bins_per_octave) / bins_per_octave)
+    ).astype(target_hs.dtype)
+    return binned
 
 
 def parse_positions(position_strings: List[str]) -> List[Tuple[int, int]]:
@@ -85,11 +185,58 @@ def main() -> None:
         default="renders",
         help="Directory where rendered images will be saved",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Maximum number of worker processes used for rendering (default: one per CPU, never more than the number of positions)",
+    )
+    parser.add_argument(
+        "--bins-per-octave",
+        type=int,
+        default=12,
+        help="Snap object sizes to this many sizes per doubling so positions share resizes; 0 renders exact sizes (default: 12, at most ~3%% size error)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["png", "jpg"],
+        default="png",
+        help="Output image format; jpg is much faster to encode for previews (default: png)",
+    )
+    parser.add_argument(
+        "--png-compression",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="{0..9}",
+        help="zlib compression level for png output (default: OpenCV's own setting)",
+    )
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        choices=range(101),
+        default=90,
+        metavar="{0..100}",
+        help="Quality for jpg output (default: 90)",
+    )
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     # Create output directory if necessary.
     os.makedirs(args.outdir, exist_ok=True)
 
+    # Encoder settings.  For PNG only pass a compression level when one is
+    # requested: OpenCV's default picks a fast level together with a
+    # matching zlib strategy, and setting the level explicitly replaces
+    # that strategy with a slower one.
+    if args.format == "png":
+        write_params = []
+        if args.png_compression is not None:
+            write_params = [cv2.IMWRITE_PNG_COMPRESSION, args.png_compression]
+    else:
+        write_params = [cv2.IMWRITE_JPEG_QUALITY, args.jpeg_quality]
+
     # Load images.
     bg_bgr = cv2.imread(args.background)
     if bg_bgr is None:
@@ -108,23 +255,47 @@ def main() -> None:
     # Convert positions from strings to tuples.
     positions = parse_positions(args.positions)
 
-    # Render the object at each specified location.
-    for i, (y_px, x_px) in enumerate(positions):
-        try:
-            rendered = paste_object(
-                bg_bgr,
-                obj_bgr,
-                obj_alpha,
-                (y_px, x_px),
-                args.height,
-                camera,
+    # Compute the object height at every position up front, snap it to a
+    # small set of size bins and submit the positions in order of size, so
+    # that placements sharing a bin tend to hit a worker's resize cache.
+    target_hs = compute_object_size_px_batch(
+        camera, bg_bgr.shape[0], [y_px for y_px, _ in positions], args.height
+    )
+    target_hs = _bin_heights(target_hs, args.bins_per_octave)
+    order = np.argsort(target_hs, kind="stable")
+    # No worker needs more cached sizes than there are distinct sizes, and
+    # since positions arrive sorted by size a handful is plenty.
+    cache_size = max(1, min(len(np.unique(target_hs[target_hs > 0])), 4))
+
+    # Render the positions in parallel.  Each worker receives the images
+    # once at start-up and renders into its own working copy.
+    with ProcessPoolExecutor(
+        # Every worker holds its own copy of the background, so never start
+        # more of them than there are positions to render.
+        max_workers=min(args.workers or os.cpu_count() or 1, len(positions)),
+        initializer=_init_worker,
+        initargs=(bg_bgr, obj_bgr, obj_alpha, cache_size),
+    ) as ex:
+        # Submit in size order for cache locality, but keep the futures
+        # indexed by position so results are reported in input order.
+        futures: List[Any] = [None] * len(positions)
+        for i in order:
+            futures[i] = ex.submit(
+                _render_one,
+                int(i),
+                positions[i],
+                int(target_hs[i]),
+                args.outdir,
+                args.format,
+                write_params,
             )
-        except ValueError as e:
-            print(f"Skipping position {(y_px, x_px)}: {e}")
-            continue
-        out_path = os.path.join(args.outdir, f"render_{i}.png")
-        cv2.imwrite(out_path, cv2.cvtColor(rendered, cv2.COLOR_BGR2RGB))
-        print(f"Wrote {out_path}")
+        for position, future in zip(positions, futures):
+            try:
+                out_path = future.result()
+            except ValueError as e:
+                print(f"Skipping position {position}: {e}")
+                continue
+            print(f"Wrote {out_path}")
 
 
 if __name__ == "__main__":